@@ -59,7 +59,7 @@ def _news_client():
     try:
         from newsapi import NewsApiClient
 
-        return NewsApiClient(api_key=key)
+        return NewsApiClient(api_key=key, session=news.http_session())
     except Exception:  # noqa: BLE001
         return None
 
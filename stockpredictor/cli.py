@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
+import multiprocessing
 import os
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
-from . import config, data, evaluation, forecast, pipeline
+from . import config, data, evaluation, forecast, news, pipeline, sentiment
 from .sanitize import sanitize_ticker
 
 
@@ -39,10 +41,28 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Also backtest SARIMAX and gradient-boosting against the baselines",
     )
+    p.add_argument(
+        "--forecast-backend",
+        choices=["statsmodels", "statsforecast", "grid"],
+        default=config.FORECAST_BACKEND,
+        help="Engine for the backtest's Holt-Winters fits (statsforecast needs the fast extra)",
+    )
     p.add_argument(
         "--no-cache", action="store_true", help="Disable the SQLite price cache / run history"
     )
     p.add_argument("--db", default="stockpredictor.db", help="SQLite database path")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=config.MAX_WORKERS,
+        help="Tickers processed concurrently (1 = serial)",
+    )
+    p.add_argument(
+        "--forecast-processes",
+        type=int,
+        default=config.FORECAST_PROCESSES,
+        help="Processes for the model fits (1 = in the worker threads, 0 = one per CPU)",
+    )
     p.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
 
     sim = p.add_argument_group(
@@ -94,7 +114,7 @@ def _make_news_client(logger) -> object | None:
     try:
         from newsapi import NewsApiClient
 
-        return NewsApiClient(api_key=key)
+        return NewsApiClient(api_key=key, session=news.http_session())
     except Exception as exc:  # noqa: BLE001
         logger.error("Could not init NewsAPI client (%s); continuing without news.", exc)
         return None
@@ -121,6 +141,17 @@ def _summarize(result: pipeline.TickerResult, logger) -> None:
         verdict,
     )
 
+    # An alternative backend is backtested under its own key; name the engine so its
+    # skill is not read as the statsmodels model's (which drives the live forecast).
+    for name, row in result.backtest.items():
+        if name.startswith("holt_winters["):
+            logger.info(
+                "%s: %s backtest MASE=%.3f (point forecasts only; forecast and bands use statsmodels)",
+                result.ticker,
+                name,
+                row.get("mase", float("nan")),
+            )
+
     # Out-of-sample interval coverage: does the 80/95% band actually cover that often?
     cov80, cov95 = hw.get("coverage80", float("nan")), hw.get("coverage95", float("nan"))
     if cov80 == cov80 or cov95 == cov95:
@@ -171,7 +202,15 @@ def _run_and_print_simulation(ticker, cfg, result, out_dir, store, logger) -> No
 
 
 def main(argv: list | None = None) -> int:
-    args = _build_parser().parse_args(argv)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if (
+        args.forecast_backend == "statsforecast"
+        and importlib.util.find_spec("statsforecast") is None
+    ):
+        parser.error(
+            "--forecast-backend statsforecast needs the fast extra: pip install -e '.[fast]'"
+        )
     logger = config.setup_logging(args.log_level)
 
     tickers: list[str] = []
@@ -191,8 +230,11 @@ def main(argv: list | None = None) -> int:
         page_size=args.pagesize,
         sentiment_enabled=not args.no_sentiment,
         sentiment_model=args.sentiment_model,
+        forecast_backend=args.forecast_backend,
         use_cache=not args.no_cache,
         db_path=args.db,
+        max_workers=args.workers,
+        forecast_processes=args.forecast_processes,
         sizing_method=args.sizing,
         rf_annual=args.rf_rate,
         commission_bps=args.commission_bps,
@@ -209,44 +251,88 @@ def main(argv: list | None = None) -> int:
     out_dir = _date_dir(cfg.outdir)
     logger.info("Saving outputs to %s", out_dir)
     news_client = _make_news_client(logger)
+    # Build the scorer once: FinBERT loads a model and VADER parses its lexicon, so
+    # per-ticker construction would repeat that work on every worker.
+    scorer: sentiment.Scorer | None = None
+    if news_client is not None:
+        try:
+            scorer = sentiment.get_scorer(cfg.sentiment_model)
+        except Exception as exc:  # noqa: BLE001 - e.g. finbert extra not installed
+            logger.error(
+                "Could not load %s scorer (%s); continuing without news.", cfg.sentiment_model, exc
+            )
+            news_client = None
 
     # Optional SQLite store: read-through price cache + run history.
     store = None
     downloader = data._default_downloader
     if cfg.use_cache:
-        from .store import Store, make_cached_downloader
+        from .store import CachedNewsClient, Store, make_cached_downloader
 
         store = Store(cfg.db_path)
         downloader = make_cached_downloader(store, data._default_downloader)
+        if news_client is not None:
+            news_client = CachedNewsClient(store, news_client)
 
     run_date = datetime.now().strftime("%Y-%m-%d")
     failures = 0
+    # Fetch + forecast + news per ticker on a thread pool (network-bound, so threads
+    # overlap the waits); persistence, plotting, and reporting stay on this thread so
+    # each ticker's files, run-history row, and scorecard are written one at a time.
+    workers = max(1, min(cfg.max_workers, len(cfg.tickers)))
+    # Model fits are CPU-bound and hold the GIL, so they optionally run in processes.
+    # "spawn" because the pool starts its workers from inside the threaded section,
+    # where forking a multi-threaded process can deadlock.
+    procs = min(cfg.forecast_processes or os.cpu_count() or 1, len(cfg.tickers))
+    fit_pool = (
+        ProcessPoolExecutor(max_workers=procs, mp_context=multiprocessing.get_context("spawn"))
+        if procs > 1
+        else None
+    )
     try:
-        for i, ticker in enumerate(cfg.tickers):
-            if i > 0:
-                time.sleep(cfg.inter_ticker_sleep)
-            try:
-                result = pipeline.run_ticker(
+        # One multi-symbol download for every ticker the cache cannot serve.
+        prices = pipeline.prefetch_prices(
+            cfg.tickers, cfg, downloader=data._default_downloader, store=store
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Collected in submission order (not as completed) so summaries, simulation
+            # output, and run-history rows are deterministic; the fetches still overlap.
+            futures = [
+                (
                     ticker,
-                    cfg,
-                    price_downloader=downloader,
-                    news_client=news_client,
-                    run_backtest=not args.no_backtest,
-                    compare_models=args.compare_models,
+                    pool.submit(
+                        pipeline.run_ticker,
+                        ticker,
+                        cfg,
+                        price_downloader=downloader,
+                        prices=prices.get(ticker),
+                        news_client=news_client,
+                        scorer=scorer,
+                        run_backtest=not args.no_backtest,
+                        compare_models=args.compare_models,
+                        fit_executor=fit_pool,
+                    ),
                 )
-                pipeline.persist_outputs(result, out_dir, cfg)
-                if store is not None:
-                    store.save_run(result, run_date, cfg)
-                _summarize(result, logger)
-                if args.simulate:
-                    _run_and_print_simulation(ticker, cfg, result, out_dir, store, logger)
-            except (ValueError, forecast.InsufficientDataError) as exc:
-                logger.error("%s: skipped — %s", ticker, exc)
-                failures += 1
-            except Exception as exc:  # noqa: BLE001 - last-resort guard, logged with trace
-                logger.exception("%s: unexpected failure — %s", ticker, exc)
-                failures += 1
+                for ticker in cfg.tickers
+            ]
+            for ticker, future in futures:
+                try:
+                    result = future.result()
+                    pipeline.persist_outputs(result, out_dir, cfg)
+                    if store is not None:
+                        store.save_run(result, run_date, cfg)
+                    _summarize(result, logger)
+                    if args.simulate:
+                        _run_and_print_simulation(ticker, cfg, result, out_dir, store, logger)
+                except (ValueError, forecast.InsufficientDataError) as exc:
+                    logger.error("%s: skipped — %s", ticker, exc)
+                    failures += 1
+                except Exception as exc:  # noqa: BLE001 - last-resort guard, logged with trace
+                    logger.exception("%s: unexpected failure — %s", ticker, exc)
+                    failures += 1
     finally:
+        if fit_pool is not None:
+            fit_pool.shutdown()
         if store is not None:
             store.close()
 
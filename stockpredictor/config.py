@@ -21,6 +21,11 @@ INTERVAL_ALPHAS = (0.05, 0.20)
 # forecast can actually be compared against); "mean" averages within the month,
 # which smooths the series and flatters every skill metric (diagnostics only).
 MONTHLY_AGG = "last"
+# Point-forecast engine for the backtest's Holt-Winters folds: "statsmodels",
+# "statsforecast" (Numba-compiled AutoETS, optional ``fast`` extra), or "grid" (a
+# vectorized grid search, see ``hwgrid``). The live forecast always uses statsmodels,
+# whose fitted model also simulates the intervals.
+FORECAST_BACKEND = "statsmodels"
 
 # --- Backtest defaults -------------------------------------------------------
 BACKTEST_FOLDS = 4
@@ -41,7 +46,17 @@ NEWS_LOOKBACK_DAYS = 30
 PAGE_SIZE = 5
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 10
-INTER_TICKER_SLEEP = 1.0
+# Concurrent NewsAPI calls across all worker threads (free-tier rate limit).
+NEWS_MAX_CONCURRENCY = 4
+
+# --- Concurrency defaults ----------------------------------------------------
+# Tickers are independent, so the CLI runs them on a small thread pool; the work is
+# dominated by network I/O (prices + news), which releases the GIL.
+MAX_WORKERS = 8
+# Processes for the CPU-bound model fits (1 = fit in the worker threads, 0 = one per
+# CPU). Off by default: each process pays a fresh interpreter + import start-up,
+# which only pays off once there are several tickers (or --compare-models) to fit.
+FORECAST_PROCESSES = 1
 
 # --- Plot defaults -----------------------------------------------------------
 PLOT_DPI = 150
@@ -94,12 +109,14 @@ class AppConfig:
     seasonal_periods: int = SEASONAL_PERIODS
     min_months_seasonal: int = MIN_MONTHS_FOR_SEASONAL
     monthly_agg: str = MONTHLY_AGG  # "last" (month-end close) | "mean" (within-month average)
+    forecast_backend: str = FORECAST_BACKEND  # "statsmodels" | "statsforecast" | "grid"
 
     page_size: int = PAGE_SIZE
     news_lookback_days: int = NEWS_LOOKBACK_DAYS
     max_retries: int = MAX_RETRIES
     request_timeout: int = REQUEST_TIMEOUT
-    inter_ticker_sleep: float = INTER_TICKER_SLEEP
+    max_workers: int = MAX_WORKERS
+    forecast_processes: int = FORECAST_PROCESSES
 
     sentiment_enabled: bool = True
     sentiment_k: float = SENTIMENT_K
@@ -10,6 +10,7 @@ poisoned the Holt-Winters trend/seasonal fit.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Callable
 
 import pandas as pd
@@ -24,11 +25,22 @@ Downloader = Callable[..., pd.DataFrame]
 # A single-month move beyond this is flagged as a suspected unadjusted action.
 _SUSPECT_MONTHLY_MOVE = 0.40
 
+# Yahoo serves at most this many symbols per multi-ticker request.
+_BATCH_SIZE = 20
+
+
+# yf.download is not thread-safe: every call resets module-global result/error
+# dicts, so overlapping calls from the CLI's worker threads can drop or clobber
+# each other's frames. Serialize them; the batch prefetch keeps this off the
+# common path.
+_YF_LOCK = threading.Lock()
+
 
 def _default_downloader(*args, **kwargs) -> pd.DataFrame:
     import yfinance as yf
 
-    return yf.download(*args, **kwargs)
+    with _YF_LOCK:
+        return yf.download(*args, **kwargs)
 
 
 def fetch_prices(
@@ -45,6 +57,54 @@ def fetch_prices(
     return df
 
 
+def _split_batch(df: pd.DataFrame, ticker: str, single: bool) -> pd.DataFrame | None:
+    """One ticker's OHLCV frame out of a ``group_by="ticker"`` multi-symbol download."""
+    if isinstance(df.columns, pd.MultiIndex):
+        if ticker not in df.columns.get_level_values(0):
+            return None
+        sub = df[ticker]
+    elif single:
+        sub = df  # some yfinance versions return flat columns for a lone symbol
+    else:
+        return None
+    # Symbols trade on different calendars; drop the rows that belong to the others.
+    return sub.dropna(how="all")
+
+
+def fetch_prices_batch(
+    tickers: list[str],
+    start: str,
+    end: str,
+    downloader: Downloader = _default_downloader,
+    auto_adjust: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """
+    Download OHLCV for many tickers with one request per ``_BATCH_SIZE`` symbols
+    instead of one per ticker. Returns ``{ticker: frame}``; symbols missing from the
+    response are omitted so the caller can fall back to ``fetch_prices`` (which
+    raises the usual per-ticker error).
+    """
+    out: dict[str, pd.DataFrame] = {}
+    for i in range(0, len(tickers), _BATCH_SIZE):
+        chunk = tickers[i : i + _BATCH_SIZE]
+        df = downloader(
+            " ".join(chunk),
+            start=start,
+            end=end,
+            progress=False,
+            auto_adjust=auto_adjust,
+            group_by="ticker",
+            threads=True,
+        )
+        if df is None or len(df) == 0:
+            continue
+        for ticker in chunk:
+            sub = _split_batch(df, ticker, single=len(chunk) == 1)
+            if sub is not None and len(sub):
+                out[ticker] = sub
+    return out
+
+
 def _extract_close(df: pd.DataFrame, ticker: str) -> pd.Series:
     """Pull a 1-D close series, tolerating yfinance's MultiIndex columns."""
     cols = df.columns
@@ -87,7 +147,9 @@ def to_monthly(df: pd.DataFrame, ticker: str, agg: str = "last") -> tuple[pd.Ser
     """
     if agg not in ("last", "mean"):
         raise ValueError(f"monthly agg must be 'last' or 'mean', got {agg!r}")
-    close, warns = validate_close(_extract_close(df, ticker))
+    # Plain float64 from here on: nullable ("Float64") or object columns would reach
+    # statsmodels as a non-float buffer and take its slow, less stable path.
+    close, warns = validate_close(_extract_close(df, ticker).astype("float64"))
     resampled = close.resample("ME")
     monthly = (resampled.last() if agg == "last" else resampled.mean()).dropna()
 
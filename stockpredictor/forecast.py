@@ -9,14 +9,16 @@ plan's "does this beat guessing?" question gets an honest answer.
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
 import warnings
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Callable
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 from . import config
 
@@ -29,6 +31,35 @@ _SIM_REPS = 1000
 _SIM_SEED = 12345  # fixed so prediction intervals are reproducible
 
 
+# ``warnings.catch_warnings`` swaps the process-wide filter list and is not
+# thread-safe: overlapping per-fit blocks on the CLI's worker threads could restore
+# each other's filters or leave "ignore" installed for good. Fits share one
+# suppression instead, installed by the first active fit and removed by the last.
+_QUIET_LOCK = threading.Lock()
+_quiet_depth = 0
+_quiet_ctx: warnings.catch_warnings | None = None
+
+
+@contextlib.contextmanager
+def _quiet_warnings() -> Iterator[None]:
+    """Thread-safe ``catch_warnings()`` + ``simplefilter("ignore")`` for model fits."""
+    global _quiet_depth, _quiet_ctx
+    with _QUIET_LOCK:
+        if _quiet_depth == 0:
+            _quiet_ctx = warnings.catch_warnings()
+            _quiet_ctx.__enter__()
+            warnings.simplefilter("ignore")
+        _quiet_depth += 1
+    try:
+        yield
+    finally:
+        with _QUIET_LOCK:
+            _quiet_depth -= 1
+            if _quiet_depth == 0 and _quiet_ctx is not None:
+                _quiet_ctx.__exit__(None, None, None)
+                _quiet_ctx = None
+
+
 class InsufficientDataError(ValueError):
     """Raised when there is not enough history to fit any forecast model."""
 
@@ -49,7 +80,9 @@ def _future_index(index: pd.Index, horizon: int) -> pd.DatetimeIndex:
 
 def _fit_holt_winters(monthly: pd.Series, cfg: config.AppConfig):
     """
-    Fit Holt-Winters, using seasonality only when there is enough history.
+    Fit Holt-Winters, using seasonality only when there is enough history. The
+    short, non-seasonal fit damps its trend so a year-long extrapolation from a
+    handful of steadily rising months does not compound into a runaway forecast.
 
     Fitting is done in *log* space (``log(price)``) whenever every value is
     positive. Additive trend/seasonal on logs is multiplicative in price, so both
@@ -59,14 +92,19 @@ def _fit_holt_winters(monthly: pd.Series, cfg: config.AppConfig):
     any value is non-positive (which should not happen after ``validate_close``).
     Returns ``(fit, seasonal_used, log_space)``.
     """
-    log_space = bool((monthly > 0).all())
-    work = np.log(monthly) if log_space else monthly
+    # Imported here, not at module level: statsmodels (and the scipy it pulls in)
+    # is most of the package's import time, and ``--help`` never fits anything.
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    values = np.ascontiguousarray(monthly.to_numpy(), dtype=np.float64)
+    log_space = bool((values > 0).all())
+    work = pd.Series(np.log(values) if log_space else values, index=monthly.index)
     seasonal = len(monthly) >= cfg.min_months_seasonal
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
+    with _quiet_warnings():
         model = ExponentialSmoothing(
             work,
             trend="add",
+            damped_trend=not seasonal,
             seasonal="add" if seasonal else None,
             seasonal_periods=cfg.seasonal_periods if seasonal else None,
             initialization_method="estimated",
@@ -75,6 +113,44 @@ def _fit_holt_winters(monthly: pd.Series, cfg: config.AppConfig):
     return fit, seasonal, log_space
 
 
+def _autoets_forecast(monthly: pd.Series, cfg: config.AppConfig, horizon: int) -> pd.Series:
+    """
+    Point forecast from statsforecast's Numba-compiled AutoETS (optional ``fast``
+    extra), mirroring ``_fit_holt_winters``: additive trend (damped when
+    non-seasonal), additive seasonality only with enough history, fitted in log
+    space when every value is positive.
+    """
+    from statsforecast.models import AutoETS  # optional dependency
+
+    values = monthly.to_numpy(dtype=np.float64)
+    log_space = bool((values > 0).all())
+    work = np.log(values) if log_space else values
+    seasonal = len(monthly) >= cfg.min_months_seasonal
+    model = AutoETS(
+        season_length=cfg.seasonal_periods if seasonal else 1,
+        model="AAA" if seasonal else "AAN",
+        damped=not seasonal,
+    )
+    out = np.asarray(model.fit(work).predict(h=horizon)["mean"], dtype=np.float64)
+    if log_space:
+        out = np.exp(out)
+    return pd.Series(out, index=_future_index(monthly.index, horizon))
+
+
+def _grid_forecast(monthly: pd.Series, cfg: config.AppConfig, horizon: int) -> pd.Series:
+    """Point forecast from the vectorized grid-search Holt-Winters (``hwgrid``)."""
+    from . import hwgrid
+
+    values = monthly.to_numpy(dtype=np.float64)
+    log_space = bool((values > 0).all())
+    work = np.log(values) if log_space else values
+    seasonal = len(monthly) >= cfg.min_months_seasonal
+    out, _ = hwgrid.fit_forecast(work, horizon, m=cfg.seasonal_periods, seasonal=seasonal)
+    if log_space:
+        out = np.exp(out)
+    return pd.Series(out, index=_future_index(monthly.index, horizon))
+
+
 def forecast_with_intervals(
     monthly: pd.Series, cfg: config.AppConfig, horizon: int | None = None
 ) -> ForecastResult:
@@ -92,6 +168,14 @@ def forecast_with_intervals(
         )
 
     h = cfg.horizon if horizon is None else horizon
+    if np.ptp(monthly.to_numpy(dtype=np.float64)) == 0:
+        # A flat series has nothing to estimate: skip the optimizer and simulation.
+        flat = pd.Series(float(monthly.iloc[-1]), index=_future_index(monthly.index, h))
+        bands = {
+            int(round((1 - a) * 100)): (flat.copy(), flat.copy()) for a in config.INTERVAL_ALPHAS
+        }
+        return ForecastResult(point=flat, intervals=bands, seasonal_used=False)
+
     fit, seasonal, log_space = _fit_holt_winters(monthly, cfg)
     point = fit.forecast(h)
     if log_space:
@@ -100,8 +184,7 @@ def forecast_with_intervals(
 
     intervals: dict[int, tuple[pd.Series, pd.Series]] = {}
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+        with _quiet_warnings():
             sims = fit.simulate(
                 nsimulations=h,
                 repetitions=_SIM_REPS,
@@ -150,10 +233,45 @@ def drift_forecast(train: pd.Series, horizon: int) -> pd.Series:
     return pd.Series([last + slope * (h + 1) for h in range(horizon)], index=idx)
 
 
-def holt_winters_model_fn(cfg: config.AppConfig) -> ModelFn:
-    """Adapt the Holt-Winters fit into a (train, horizon) -> point-series fn."""
+_FALLBACK_LOCK = threading.Lock()
+_FALLBACK_WARNED: set[str] = set()
+
+
+def _warn_fallback(backend: str, exc: Exception) -> None:
+    """Log a backend falling back to statsmodels: WARNING once per process, then DEBUG."""
+    with _FALLBACK_LOCK:
+        first = backend not in _FALLBACK_WARNED
+        _FALLBACK_WARNED.add(backend)
+    logger.log(
+        logging.WARNING if first else logging.DEBUG,
+        "%s backend failed (%s); falling back to statsmodels",
+        backend,
+        exc,
+    )
+
+
+def holt_winters_model_fn(cfg: config.AppConfig, backend: str | None = None) -> ModelFn:
+    """
+    Adapt the Holt-Winters fit into a (train, horizon) -> point-series fn.
+
+    ``backend`` defaults to ``cfg.forecast_backend``. ``"statsforecast"`` fits
+    through AutoETS and ``"grid"`` through the dependency-free grid search in
+    ``hwgrid``; both fall back to statsmodels (with a one-time warning) when the
+    package is missing or the fit fails.
+    """
+    engine = backend or cfg.forecast_backend
 
     def _fn(train: pd.Series, horizon: int) -> pd.Series:
+        if engine == "grid":
+            try:
+                return _grid_forecast(train, cfg, horizon)
+            except Exception as exc:  # noqa: BLE001 - alternative backend, degrade loudly once
+                _warn_fallback(engine, exc)
+        if engine == "statsforecast":
+            try:
+                return _autoets_forecast(train, cfg, horizon)
+            except Exception as exc:  # noqa: BLE001 - optional backend, degrade loudly once
+                _warn_fallback(engine, exc)
         fit, _, log_space = _fit_holt_winters(train, cfg)
         out = fit.forecast(horizon)
         if log_space:
@@ -165,9 +283,18 @@ def holt_winters_model_fn(cfg: config.AppConfig) -> ModelFn:
 
 
 def default_models(cfg: config.AppConfig) -> dict[str, ModelFn]:
-    """The standard panel: the model plus the baselines it must beat."""
-    return {
-        "holt_winters": holt_winters_model_fn(cfg),
+    """
+    The standard panel: the model plus the baselines it must beat.
+
+    ``"holt_winters"`` is always the statsmodels fit, the same engine behind the
+    live forecast and the coverage numbers. An alternative ``cfg.forecast_backend``
+    gets its own ``"holt_winters[<backend>]"`` row so its skill is never reported
+    under the statsmodels name.
+    """
+    models: dict[str, ModelFn] = {"holt_winters": holt_winters_model_fn(cfg, "statsmodels")}
+    if cfg.forecast_backend != "statsmodels":
+        models[f"holt_winters[{cfg.forecast_backend}]"] = holt_winters_model_fn(cfg)
+    return models | {
         "naive": naive_forecast,
         "seasonal_naive": lambda t, h: seasonal_naive_forecast(t, h, cfg.seasonal_periods),
         "drift": drift_forecast,
@@ -0,0 +1,79 @@
+"""
+Grid-searched additive Holt-Winters, vectorized across the parameter grid.
+
+statsmodels fits Holt-Winters with a general-purpose L-BFGS-B optimizer: dozens of
+Python-level objective evaluations per fit. For the short monthly series here a
+coarse (alpha, beta, gamma) grid is plenty, and running the smoothing recursion for
+every grid point at once turns each time step into a handful of NumPy operations —
+a single pass over the series scores the whole grid.
+
+Point forecasts only; the live forecast keeps statsmodels, whose fitted model also
+simulates the prediction intervals.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Coarse smoothing grid. Trend and seasonal weights stay small: monthly prices
+# rarely justify re-estimating either component quickly.
+_ALPHAS = np.linspace(0.1, 0.9, 9)
+_BETAS = np.array([0.01, 0.05, 0.1, 0.2, 0.3])
+_GAMMAS = np.array([0.01, 0.05, 0.1, 0.2, 0.3])
+# Trend damping for the short, non-seasonal fit (as statsmodels and AutoETS do), so
+# a year-long extrapolation from a few rising months cannot run away.
+_PHIS = np.array([0.8, 0.85, 0.9, 0.95, 0.98])
+
+
+def _grid(seasonal: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    gammas = _GAMMAS if seasonal else np.zeros(1)
+    phis = np.ones(1) if seasonal else _PHIS
+    a, b, g, p = np.meshgrid(_ALPHAS, _BETAS, gammas, phis, indexing="ij")
+    return a.ravel(), b.ravel(), g.ravel(), p.ravel()
+
+
+def fit_forecast(
+    y: np.ndarray, horizon: int, m: int = 12, seasonal: bool = True
+) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+    """
+    Fit additive Holt-Winters by minimum in-sample one-step SSE over the grid and
+    forecast ``horizon`` steps. Without ``seasonal`` this is Holt's damped trend.
+    Returns ``(forecast, (alpha, beta, gamma, phi))``.
+    """
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = len(y)
+    if seasonal and n < 2 * m:
+        raise ValueError(f"seasonal fit needs >= {2 * m} points, got {n}")
+    if n < 2:
+        raise ValueError(f"need >= 2 points, got {n}")
+
+    alpha, beta, gamma, phi = _grid(seasonal)
+    if seasonal:
+        level0 = y[:m].mean()
+        trend0 = (y[m : 2 * m].mean() - level0) / m
+        season0 = y[:m] - level0
+    else:
+        m = 1
+        trend0 = y[1] - y[0]
+        level0, season0 = y[0] - phi * trend0, np.zeros(1)  # so the first forecast is y[0]
+
+    level = np.broadcast_to(level0, alpha.shape).astype(np.float64)
+    trend = np.full(alpha.size, trend0)
+    season = np.tile(season0, (alpha.size, 1))
+    sse = np.zeros(alpha.size)
+    for t in range(n):
+        i = t % m
+        s = season[:, i].copy()
+        damped = phi * trend
+        err = y[t] - (level + damped + s)
+        sse += err * err
+        new_level = alpha * (y[t] - s) + (1 - alpha) * (level + damped)
+        trend = beta * (new_level - level) + (1 - beta) * damped
+        season[:, i] = gamma * (y[t] - new_level) + (1 - gamma) * s
+        level = new_level
+
+    best = int(np.argmin(sse))
+    steps = np.arange(1, horizon + 1)
+    trend_mult = np.cumsum(phi[best] ** steps)  # phi + phi^2 + ... + phi^h
+    out = level[best] + trend_mult * trend[best] + season[best, (n + steps - 1) % m]
+    return out, (float(alpha[best]), float(beta[best]), float(gamma[best]), float(phi[best]))
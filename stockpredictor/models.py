@@ -15,13 +15,12 @@ payoff at this volume.
 from __future__ import annotations
 
 import logging
-import warnings
 
 import numpy as np
 import pandas as pd
 
 from . import config, forecast
-from .forecast import ModelFn, _future_index
+from .forecast import ModelFn, _future_index, _quiet_warnings
 
 logger = logging.getLogger("stockpredictor.models")
 
@@ -36,8 +35,7 @@ def sarimax_model_fn(cfg: config.AppConfig) -> ModelFn:
             if len(train) >= cfg.min_months_seasonal
             else (0, 0, 0, 0)
         )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+        with _quiet_warnings():
             fit = SARIMAX(
                 train.to_numpy(),
                 order=(1, 1, 1),
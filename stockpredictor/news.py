@@ -12,8 +12,10 @@ mocked client. Two key fixes over the original:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Callable
 
 from . import config
@@ -24,54 +26,88 @@ logger = logging.getLogger("stockpredictor.news")
 # NewsAPI free tier only serves roughly the last month of articles.
 _FREE_TIER_DAYS = 30
 
-_COMPANY_NAMES = {
-    "AAPL": "Apple",
-    "MSFT": "Microsoft",
-    "GOOGL": "Google",
-    "GOOG": "Google",
-    "AMZN": "Amazon",
-    "TSLA": "Tesla",
-    "META": "Meta",
-    "NVDA": "NVIDIA",
-    "NFLX": "Netflix",
-    "BA": "Boeing",
-    "JPM": "JPMorgan",
-    "JNJ": "Johnson & Johnson",
-    "V": "Visa",
-    "PG": "Procter & Gamble",
-    "UNH": "UnitedHealth",
-    "HD": "Home Depot",
-    "MA": "Mastercard",
-    "PFE": "Pfizer",
-    "DIS": "Disney",
-    "VZ": "Verizon",
-    "ADBE": "Adobe",
-    "KO": "Coca-Cola",
-    "PEP": "PepsiCo",
-    "T": "AT&T",
-    "CVX": "Chevron",
-    "WMT": "Walmart",
-    "XOM": "ExxonMobil",
-    "INTC": "Intel",
-    "IBM": "IBM",
-    "ORCL": "Oracle",
-    "CSCO": "Cisco",
-    "CRM": "Salesforce",
-    "AVGO": "Broadcom",
-    "GME": "GameStop",
-    "AMC": "AMC Entertainment",
-    "BB": "BlackBerry",
-    "NOK": "Nokia",
-    "PLTR": "Palantir",
-    "RBLX": "Roblox",
-    "AMD": "AMD",
-    "QCOM": "Qualcomm",
-    "TSM": "Taiwan Semiconductor",
-    "BAC": "Bank of America",
-    "GS": "Goldman Sachs",
-    "AXP": "American Express",
-    "NOW": "ServiceNow",
-}
+# Shared by every worker thread so concurrent tickers stay under the NewsAPI rate
+# limit. Only the request itself holds a slot; retry backoff sleeps outside it.
+_NEWS_SLOTS = threading.BoundedSemaphore(config.NEWS_MAX_CONCURRENCY)
+
+# Built once at import and read-only, so the table the worker threads share cannot
+# be mutated mid-run.
+_COMPANY_NAMES = MappingProxyType(
+    {
+        "AAPL": "Apple",
+        "MSFT": "Microsoft",
+        "GOOGL": "Google",
+        "GOOG": "Google",
+        "AMZN": "Amazon",
+        "TSLA": "Tesla",
+        "META": "Meta",
+        "NVDA": "NVIDIA",
+        "NFLX": "Netflix",
+        "BA": "Boeing",
+        "JPM": "JPMorgan",
+        "JNJ": "Johnson & Johnson",
+        "V": "Visa",
+        "PG": "Procter & Gamble",
+        "UNH": "UnitedHealth",
+        "HD": "Home Depot",
+        "MA": "Mastercard",
+        "PFE": "Pfizer",
+        "DIS": "Disney",
+        "VZ": "Verizon",
+        "ADBE": "Adobe",
+        "KO": "Coca-Cola",
+        "PEP": "PepsiCo",
+        "T": "AT&T",
+        "CVX": "Chevron",
+        "WMT": "Walmart",
+        "XOM": "ExxonMobil",
+        "INTC": "Intel",
+        "IBM": "IBM",
+        "ORCL": "Oracle",
+        "CSCO": "Cisco",
+        "CRM": "Salesforce",
+        "AVGO": "Broadcom",
+        "GME": "GameStop",
+        "AMC": "AMC Entertainment",
+        "BB": "BlackBerry",
+        "NOK": "Nokia",
+        "PLTR": "Palantir",
+        "RBLX": "Roblox",
+        "AMD": "AMD",
+        "QCOM": "Qualcomm",
+        "TSM": "Taiwan Semiconductor",
+        "BAC": "Bank of America",
+        "GS": "Goldman Sachs",
+        "AXP": "American Express",
+        "NOW": "ServiceNow",
+    }
+)
+
+
+def http_session():
+    """
+    Keep-alive ``requests.Session`` for the NewsAPI client, so every ticker after
+    the first reuses a pooled TLS connection instead of a fresh handshake.
+
+    The adapter retries only connection errors and 5xx responses, briefly; rate
+    limiting (429 / ``rateLimited``) is left to ``fetch_articles``, whose backoff
+    sleeps outside the shared request slot.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=config.NEWS_MAX_CONCURRENCY, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
 
 
 def ticker_to_company_name(ticker: str) -> str:
@@ -94,14 +130,17 @@ def _news_window(end_date: str | None, lookback_days: int) -> tuple[str, str]:
     return start_dt.isoformat(), end_dt.isoformat()
 
 
-def _normalize(art: dict) -> dict[str, object]:
-    return {
-        "title": art.get("title") or "",
-        "description": art.get("description") or "",
-        "url": art.get("url"),
-        "source": (art.get("source") or {}).get("name"),
-        "publishedAt": art.get("publishedAt"),
-    }
+def _normalize(articles: list[dict]) -> list[dict[str, object]]:
+    """Flatten a NewsAPI page into article dicts, one column at a time."""
+    titles = [a.get("title") or "" for a in articles]
+    descriptions = [a.get("description") or "" for a in articles]
+    urls = [a.get("url") for a in articles]
+    sources = [(a.get("source") or {}).get("name") for a in articles]
+    published = [a.get("publishedAt") for a in articles]
+    return [
+        {"title": t, "description": d, "url": u, "source": s, "publishedAt": p}
+        for t, d, u, s, p in zip(titles, descriptions, urls, sources, published)
+    ]
 
 
 def fetch_articles(
@@ -153,7 +192,8 @@ def fetch_articles(
                 kwargs["from_param"] = win_from
                 kwargs["to"] = win_to
 
-            resp = client.get_everything(**kwargs)
+            with _NEWS_SLOTS:
+                resp = client.get_everything(**kwargs)
 
             if resp.get("code"):
                 code, msg = resp.get("code", ""), resp.get("message", "")
@@ -178,7 +218,7 @@ def fetch_articles(
                     continue
             else:
                 logger.info("%s: fetched %d articles", log_ticker, len(articles))
-                return [_normalize(a) for a in articles]
+                return _normalize(articles)
 
         except Exception as exc:  # noqa: BLE001 - networking is best-effort
             msg = str(exc)
@@ -10,6 +10,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -17,7 +19,7 @@ import pandas as pd
 
 from . import config, data, evaluation, forecast, news, portfolio, sentiment, strategy
 from .forecast import ForecastResult
-from .sanitize import sanitize_ticker
+from .sanitize import sanitize_ticker, scrub
 from .sentiment import Scorer, SentimentResult
 
 logger = logging.getLogger("stockpredictor.pipeline")
@@ -35,31 +37,98 @@ class TickerResult:
     warnings: list[str] = field(default_factory=list)
 
 
+def prefetch_prices(
+    tickers: list[str],
+    cfg: config.AppConfig,
+    *,
+    downloader: data.Downloader = data._default_downloader,
+    store: Any | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Daily prices for many tickers up front: served from ``store`` when fresh, the
+    rest in one batched download (``data.fetch_prices_batch``) and written back to
+    the store. Best-effort — any ticker missing from the result is simply fetched
+    per ticker by ``run_ticker`` as before.
+    """
+    prices: dict[str, pd.DataFrame] = {}
+    if store is not None:
+        for ticker in tickers:
+            cached = store.cached_prices(ticker, cfg.start, cfg.end)
+            if cached is not None and len(cached):
+                prices[ticker] = cached
+    missing = [t for t in tickers if t not in prices]
+    if not missing:
+        return prices
+    try:
+        fetched = data.fetch_prices_batch(missing, cfg.start, cfg.end, downloader=downloader)
+    except Exception as exc:  # noqa: BLE001 - batching is an optimization only
+        logger.warning("Batch price download failed (%s); fetching per ticker.", scrub(exc))
+        return prices
+    for ticker, df in fetched.items():
+        if store is not None:
+            try:
+                store.upsert_prices(ticker, df)
+            except Exception as exc:  # noqa: BLE001 - caching must never break a run
+                logger.warning("%s: could not cache prices: %s", ticker, scrub(exc))
+        prices[ticker] = df
+    return prices
+
+
+def forecast_ticker(
+    monthly: pd.Series,
+    cfg: config.AppConfig,
+    run_backtest: bool = True,
+    compare_models: bool = False,
+) -> tuple[ForecastResult, dict[str, dict[str, float]]]:
+    """
+    The CPU-bound half of ``run_ticker``: forecast with intervals plus the optional
+    backtest. Module-level and fed only picklable arguments, so it can run in a
+    process pool.
+    """
+    fcast = forecast.forecast_with_intervals(monthly, cfg)
+    bt: dict[str, dict[str, float]] = {}
+    if run_backtest:
+        bt_models = None
+        if compare_models:
+            from . import models as _models
+
+            bt_models = _models.extended_models(cfg)
+        bt = forecast.backtest(monthly, cfg, models=bt_models)
+    return fcast, bt
+
+
 def run_ticker(
     ticker: str,
     cfg: config.AppConfig,
     *,
     price_downloader: data.Downloader = data._default_downloader,
+    prices: pd.DataFrame | None = None,
     news_client: Any | None = None,
     scorer: Scorer | None = None,
     run_backtest: bool = True,
     compare_models: bool = False,
+    fit_executor: Executor | None = None,
 ) -> TickerResult:
-    """Fetch, forecast (with intervals + backtest), score news, and apply the tilt."""
+    """
+    Fetch, forecast (with intervals + backtest), score news, and apply the tilt.
+
+    ``prices`` accepts an already-downloaded daily frame (see ``prefetch_prices``);
+    without it the ticker is fetched through ``price_downloader``. ``fit_executor``
+    (typically a process pool) runs ``forecast_ticker`` off this thread while the
+    news is fetched, so the model fits are not serialized behind the GIL.
+    """
     # Validate before the symbol becomes a file name in persist_outputs/plotting.
     ticker = sanitize_ticker(ticker)
-    df = data.fetch_prices(ticker, cfg.start, cfg.end, downloader=price_downloader)
+    df = prices
+    if df is None:
+        df = data.fetch_prices(ticker, cfg.start, cfg.end, downloader=price_downloader)
     monthly, warns = data.to_monthly(df, ticker, agg=cfg.monthly_agg)
 
-    fcast = forecast.forecast_with_intervals(monthly, cfg)
-    bt = {}
-    if run_backtest:
-        bt_models = None
-        if compare_models:
-            from . import models as _models
-
-            bt_models = _models.extended_models(cfg)
-        bt = forecast.backtest(monthly, cfg, models=bt_models)
+    pending: Future | None = None
+    if fit_executor is not None:
+        pending = fit_executor.submit(forecast_ticker, monthly, cfg, run_backtest, compare_models)
+    else:
+        fcast, bt = forecast_ticker(monthly, cfg, run_backtest, compare_models)
 
     articles: list[dict[str, Any]] = []
     if news_client is not None:
@@ -72,6 +141,13 @@ def run_ticker(
     else:
         sent = sentiment.aggregate_sentiment([])
 
+    if pending is not None:
+        try:
+            fcast, bt = pending.result()
+        except BrokenProcessPool:
+            logger.warning("%s: fit worker died; fitting in-process instead.", ticker)
+            fcast, bt = forecast_ticker(monthly, cfg, run_backtest, compare_models)
+
     adjusted = sentiment.apply_sentiment_tilt(fcast.point, sent, cfg)
 
     return TickerResult(
@@ -264,6 +340,18 @@ def metrics_payload(result: TickerResult) -> dict[str, Any]:
     }
 
 
+def _write_json(path: str, payload: Any) -> None:
+    """Pretty-printed JSON via orjson when installed (optional ``fast`` extra), else stdlib."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+        return
+    with open(path, "wb") as fh:
+        fh.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+
 def persist_outputs(result: TickerResult, out_dir: str, cfg: config.AppConfig) -> dict[str, str]:
     """Write news.json, metrics.json, the PNG, and (if plotly is present) the HTML."""
     from . import plotting
@@ -273,8 +361,7 @@ def persist_outputs(result: TickerResult, out_dir: str, cfg: config.AppConfig) -
 
     news_path = os.path.join(out_dir, f"{result.ticker}_news.json")
     try:
-        with open(news_path, "w", encoding="utf-8") as fh:
-            json.dump(result.articles, fh, indent=2)
+        _write_json(news_path, result.articles)
         paths["news"] = news_path
     except OSError as exc:
         logger.error("%s: could not write news JSON: %s", result.ticker, exc)
@@ -20,6 +20,26 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 
 logger = logging.getLogger("stockpredictor.plotting")
 
+# Static-PNG rendering settings. Fixed margins replace ``tight_layout`` (a layout
+# solve on every figure) and sized for the 11x6in canvas plus its bottom-right
+# disclaimer; fast zlib + no metadata chunk keep PNG encoding cheap.
+_FIGSIZE = (11, 6)
+_MARGINS = {"left": 0.07, "right": 0.98, "top": 0.93, "bottom": 0.11}
+_PNG_KWARGS = {"metadata": {"Software": None}, "pil_kwargs": {"compress_level": 1}}
+
+
+def _new_figure():
+    """
+    A bare Agg-rendered ``Figure`` and its axes. Built directly rather than through
+    ``pyplot``, so there is no global figure manager to register with or close, and
+    rendering is safe to call from any thread.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=_FIGSIZE)
+    fig.subplots_adjust(**_MARGINS)
+    return fig, fig.add_subplot()
+
 
 def plot_forecast(
     monthly: pd.Series,
@@ -31,12 +51,7 @@ def plot_forecast(
     sentiment_label: str = "",
 ) -> str:
     """Save a PNG: history, forecast, shaded intervals, and sentiment-adjusted line."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    fig, ax = plt.subplots(figsize=(11, 6))
+    fig, ax = _new_figure()
     ax.plot(monthly.index, monthly.values, label="Historical", color="#1f77b4")
     ax.plot(result.point.index, result.point.values, label="Forecast", color="#ff7f0e", linewidth=2)
 
@@ -80,11 +95,9 @@ def plot_forecast(
         color="gray",
         style="italic",
     )
-    fig.tight_layout()
 
     path = os.path.join(out_dir, f"{ticker}_forecasts.png")
-    fig.savefig(path, dpi=cfg.plot_dpi)
-    plt.close(fig)
+    fig.savefig(path, dpi=cfg.plot_dpi, **_PNG_KWARGS)
     logger.info("%s: saved plot %s", ticker, path)
     return path
 
@@ -100,12 +113,7 @@ def plot_equity_curve(
     ``result`` is a ``portfolio.SimulationResult``; imported lazily to avoid a
     hard dependency from ``plotting`` onto the simulation layer.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    fig, ax = plt.subplots(figsize=(11, 6))
+    fig, ax = _new_figure()
     ax.plot(
         result.equity.index,
         result.equity.values,
@@ -143,11 +151,9 @@ def plot_equity_curve(
         color="gray",
         style="italic",
     )
-    fig.tight_layout()
 
     path = os.path.join(out_dir, f"{ticker}_SIM_equity.png")
-    fig.savefig(path, dpi=cfg.plot_dpi)
-    plt.close(fig)
+    fig.savefig(path, dpi=cfg.plot_dpi, **_PNG_KWARGS)
     logger.info("%s: saved equity curve %s", ticker, path)
     return path
 
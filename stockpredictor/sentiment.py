@@ -13,6 +13,9 @@ horizon, replacing the old unbounded ``forecast * (1 + sentiment)``.
 
 from __future__ import annotations
 
+import functools
+import re
+import threading
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
@@ -26,25 +29,40 @@ from . import config
 _CONFIDENCE_FULL_N = 8
 _CONFIDENCE_MAX_DISPERSION = 0.5  # ~ std of VADER compound across mixed headlines
 
+# Pictographic emoji, stripped before VADER scoring. VADER rebuilds the text
+# character by character to translate emoji into lexicon words, which slows to a
+# crawl on emoji-heavy input. Stripping them changes scores (see CHANGELOG).
+_EMOJI_RE = re.compile("[\U0001f300-\U0001faff]+")
+
 
 class Scorer(Protocol):
-    """Anything that turns a piece of text into a signed sentiment in [-1, 1]."""
+    """
+    Anything that turns a piece of text into a signed sentiment in [-1, 1].
+
+    A scorer may also offer ``score_batch(texts) -> list[float]``; ``score_articles``
+    prefers it so model-backed scorers can run every headline in one call.
+    """
 
     def score(self, text: str) -> float:  # pragma: no cover - protocol
         ...
 
 
+@functools.lru_cache(maxsize=1)
+def _get_analyzer():
+    """One VADER analyzer per process: construction re-reads and parses its lexicons."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
+
 class VaderScorer:
     """Default zero-dependency scorer wrapping vaderSentiment's analyzer."""
 
     def __init__(self, analyzer=None) -> None:
-        if analyzer is None:
-            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-            analyzer = SentimentIntensityAnalyzer()
-        self._analyzer = analyzer
+        self._analyzer = analyzer if analyzer is not None else _get_analyzer()
 
     def score(self, text: str) -> float:
+        text = _EMOJI_RE.sub("", text) if text else text
         if not text:
             return 0.0
         return float(self._analyzer.polarity_scores(text)["compound"])
@@ -54,18 +72,40 @@ class FinBertScorer:
     """
     Finance-tuned scorer. Lazy-imports transformers/torch so the dependency stays
     optional. Signed score = P(positive) - P(negative).
+
+    One instance is shared by the CLI's worker threads, but a pipeline is not safe
+    to call concurrently (its fast tokenizer raises "Already borrowed"), so every
+    call goes through a lock.
     """
 
     def __init__(self, model_name: str = "ProsusAI/finbert") -> None:
         from transformers import pipeline  # imported lazily on purpose
 
         self._pipe = pipeline("text-classification", model=model_name, top_k=None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signed(labels: list[dict]) -> float:
+        scores = {d["label"].lower(): d["score"] for d in labels}
+        return float(scores.get("positive", 0.0) - scores.get("negative", 0.0))
 
     def score(self, text: str) -> float:
         if not text:
             return 0.0
-        scores = {d["label"].lower(): d["score"] for d in self._pipe(text[:512])[0]}
-        return float(scores.get("positive", 0.0) - scores.get("negative", 0.0))
+        with self._lock:
+            labels = self._pipe(text[:512])[0]
+        return self._signed(labels)
+
+    def score_batch(self, texts: Sequence[str]) -> list[float]:
+        """Score many texts in one pipeline call so the model batches them."""
+        out = [0.0] * len(texts)
+        idx = [i for i, text in enumerate(texts) if text]
+        if idx:
+            with self._lock:
+                batch = self._pipe([texts[i][:512] for i in idx])
+            for i, labels in zip(idx, batch):
+                out[i] = self._signed(labels)
+        return out
 
 
 def get_scorer(model: str = "vader", analyzer=None) -> Scorer:
@@ -132,13 +172,13 @@ def aggregate_sentiment(scores: Sequence[float]) -> SentimentResult:
 
 def score_articles(articles: Sequence[dict], scorer: Scorer) -> list[float]:
     """Score a list of article dicts (title + description) → list of scores."""
-    out: list[float] = []
-    for art in articles:
-        title = art.get("title") or ""
-        desc = art.get("description") or ""
-        combined = f"{title}. {desc}".strip(". ")
-        out.append(scorer.score(combined))
-    return out
+    texts = [
+        f"{art.get('title') or ''}. {art.get('description') or ''}".strip(". ") for art in articles
+    ]
+    batch = getattr(scorer, "score_batch", None)
+    if batch is not None:
+        return [float(x) for x in batch(texts)]
+    return [scorer.score(text) for text in texts]
 
 
 def apply_sentiment_tilt(
@@ -1,15 +1,18 @@
 """
-Optional SQLite store (stdlib ``sqlite3``, zero infra): a read-through price cache
-plus run history. Persisting each run — and keeping article ``publishedAt`` — lets
-runs be reproducible, quota-friendly, and (over time) accumulates the aligned
-(sentiment → forward return) panel needed to one day *learn* the sentiment tilt.
+Optional SQLite store (stdlib ``sqlite3``, zero infra): read-through price and
+NewsAPI caches plus run history. Persisting each run — and keeping article
+``publishedAt`` — lets runs be reproducible, quota-friendly, and (over time)
+accumulates the aligned (sentiment → forward return) panel needed to one day
+*learn* the sentiment tilt.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import sqlite3
+import threading
 from datetime import date, datetime, timedelta
 
 import pandas as pd
@@ -41,20 +44,30 @@ CREATE TABLE IF NOT EXISTS simulations (
     excess_cagr_vs_bh REAL, excess_sharpe_vs_bh REAL, strategy_cagr REAL,
     max_drawdown REAL, turnover_annual REAL, scorecard_json TEXT
 );
+CREATE TABLE IF NOT EXISTS news_cache (
+    key TEXT PRIMARY KEY, response_json TEXT, fetched_at TEXT
+);
 """
 
 
 class Store:
-    """Thin wrapper over a SQLite connection."""
+    """Thin wrapper over a SQLite connection.
+
+    The CLI shares one store across its worker threads (the cached downloader runs
+    inside them), so the connection is opened thread-agnostic and every statement is
+    serialized through a lock.
+    """
 
     def __init__(self, path: str = "stockpredictor.db") -> None:
-        self.conn = sqlite3.connect(path)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         self.conn.executescript(_SCHEMA)
         self.conn.commit()
 
     def close(self) -> None:
-        self.conn.close()
+        with self._lock:
+            self.conn.close()
 
     def __enter__(self) -> Store:
         return self
@@ -92,17 +105,18 @@ class Store:
                 [fetched] * n,
             )
         )
-        self.conn.executemany("INSERT OR REPLACE INTO prices VALUES (?,?,?,?,?,?,?,?)", rows)
-        self.conn.commit()
+        with self._lock:
+            self.conn.executemany("INSERT OR REPLACE INTO prices VALUES (?,?,?,?,?,?,?,?)", rows)
+            self.conn.commit()
 
     def cached_prices(
         self, ticker: str, start: str, end: str, ttl_days: int = 1
     ) -> pd.DataFrame | None:
-        cur = self.conn.execute(
-            "SELECT * FROM prices WHERE ticker=? AND date BETWEEN ? AND ? ORDER BY date",
-            (ticker, start, end),
-        )
-        rows = cur.fetchall()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM prices WHERE ticker=? AND date BETWEEN ? AND ? ORDER BY date",
+                (ticker, start, end),
+            ).fetchall()
         if not rows:
             return None
         end_dt = datetime.strptime(end, "%Y-%m-%d").date()
@@ -122,58 +136,82 @@ class Store:
         logger.info("%s: price cache hit (%d rows)", scrub(ticker), len(rows))
         return pd.DataFrame(data, index=idx)
 
+    # --- news cache ----------------------------------------------------------
+    def cached_news(self, key: str, ttl_hours: float = 6) -> dict | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response_json, fetched_at FROM news_cache WHERE key=?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if datetime.now() - datetime.fromisoformat(row["fetched_at"]) > timedelta(hours=ttl_hours):
+            return None
+        return json.loads(row["response_json"])
+
+    def put_news(self, key: str, response: dict) -> None:
+        fetched = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO news_cache VALUES (?,?,?)",
+                (key, json.dumps(response), fetched),
+            )
+            self.conn.commit()
+
     # --- run history ---------------------------------------------------------
     def save_run(self, result, run_date: str, cfg) -> int:
         from .pipeline import metrics_payload
 
         payload = metrics_payload(result)
-        cur = self.conn.execute(
-            'INSERT INTO runs (ticker, run_date, start, "end", horizon, seasonal_used, '
-            "sentiment_mean, sentiment_effective, sentiment_n, sentiment_label, "
-            "forecast_json, backtest_json) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
-            (
-                result.ticker,
-                run_date,
-                cfg.start,
-                cfg.end,
-                cfg.horizon,
-                int(result.forecast.seasonal_used),
-                result.sentiment.mean,
-                result.sentiment.effective,
-                result.sentiment.n_articles,
-                result.sentiment.label(),
-                json.dumps(
-                    {k: payload[k] for k in ("forecast", "adjusted", "intervals", "horizon_index")}
-                ),
-                json.dumps(result.backtest),
+        row = (
+            result.ticker,
+            run_date,
+            cfg.start,
+            cfg.end,
+            cfg.horizon,
+            int(result.forecast.seasonal_used),
+            result.sentiment.mean,
+            result.sentiment.effective,
+            result.sentiment.n_articles,
+            result.sentiment.label(),
+            json.dumps(
+                {k: payload[k] for k in ("forecast", "adjusted", "intervals", "horizon_index")}
             ),
+            json.dumps(result.backtest),
         )
-        run_id = int(cur.lastrowid or 0)
-        self.conn.executemany(
-            "INSERT INTO articles VALUES (?,?,?,?,?,?,?)",
-            [
-                (
-                    run_id,
-                    result.ticker,
-                    a.get("url"),
-                    a.get("title"),
-                    a.get("source"),
-                    a.get("publishedAt"),
-                    a.get("sentiment"),
-                )
-                for a in result.articles
-            ],
-        )
-        self.conn.commit()
+        with self._lock:
+            cur = self.conn.execute(
+                'INSERT INTO runs (ticker, run_date, start, "end", horizon, seasonal_used, '
+                "sentiment_mean, sentiment_effective, sentiment_n, sentiment_label, "
+                "forecast_json, backtest_json) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
+                row,
+            )
+            run_id = int(cur.lastrowid or 0)
+            self.conn.executemany(
+                "INSERT INTO articles VALUES (?,?,?,?,?,?,?)",
+                [
+                    (
+                        run_id,
+                        result.ticker,
+                        a.get("url"),
+                        a.get("title"),
+                        a.get("source"),
+                        a.get("publishedAt"),
+                        a.get("sentiment"),
+                    )
+                    for a in result.articles
+                ],
+            )
+            self.conn.commit()
         return run_id
 
     def history(self, ticker: str) -> pd.DataFrame:
-        return pd.read_sql_query(
-            "SELECT run_date, sentiment_label, sentiment_mean, sentiment_effective, "
-            "sentiment_n, seasonal_used FROM runs WHERE ticker=? ORDER BY run_date",
-            self.conn,
-            params=(ticker.upper(),),
-        )
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT run_date, sentiment_label, sentiment_mean, sentiment_effective, "
+                "sentiment_n, seasonal_used FROM runs WHERE ticker=? ORDER BY run_date",
+                self.conn,
+                params=(ticker.upper(),),
+            )
 
     # --- simulation history (multiple-testing accounting) --------------------
     def save_simulation(self, ticker: str, variant_id: str, scorecard, cfg) -> int:
@@ -184,46 +222,49 @@ class Store:
         attempted (brief §3.5).
         """
         run_date = datetime.now().isoformat(timespec="seconds")
-        cur = self.conn.execute(
-            "INSERT INTO simulations (ticker, run_date, variant_id, sizing_method, "
-            "rf_annual, beat_bh, beat_rf, excess_cagr_vs_bh, excess_sharpe_vs_bh, "
-            "strategy_cagr, max_drawdown, turnover_annual, scorecard_json) "
-            "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
-            (
-                ticker.upper(),
-                run_date,
-                variant_id,
-                cfg.sizing_method,
-                cfg.rf_annual,
-                int(scorecard.beat_buy_and_hold),
-                int(scorecard.beat_risk_free),
-                scorecard.excess_cagr_vs_bh,
-                scorecard.excess_sharpe_vs_bh,
-                scorecard.strategy.cagr,
-                scorecard.max_drawdown,
-                scorecard.turnover_annual,
-                json.dumps(scorecard.as_dict()),
-            ),
+        row = (
+            ticker.upper(),
+            run_date,
+            variant_id,
+            cfg.sizing_method,
+            cfg.rf_annual,
+            int(scorecard.beat_buy_and_hold),
+            int(scorecard.beat_risk_free),
+            scorecard.excess_cagr_vs_bh,
+            scorecard.excess_sharpe_vs_bh,
+            scorecard.strategy.cagr,
+            scorecard.max_drawdown,
+            scorecard.turnover_annual,
+            json.dumps(scorecard.as_dict()),
         )
-        self.conn.commit()
+        with self._lock:
+            cur = self.conn.execute(
+                "INSERT INTO simulations (ticker, run_date, variant_id, sizing_method, "
+                "rf_annual, beat_bh, beat_rf, excess_cagr_vs_bh, excess_sharpe_vs_bh, "
+                "strategy_cagr, max_drawdown, turnover_annual, scorecard_json) "
+                "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                row,
+            )
+            self.conn.commit()
         return int(cur.lastrowid or 0)
 
     def count_simulations(self, ticker: str) -> int:
         """How many simulation variants have been logged for this ticker (≥ 1)."""
-        cur = self.conn.execute(
-            "SELECT COUNT(*) AS n FROM simulations WHERE ticker=?", (ticker.upper(),)
-        )
-        row = cur.fetchone()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS n FROM simulations WHERE ticker=?", (ticker.upper(),)
+            ).fetchone()
         return int(row["n"]) if row else 0
 
     def simulation_history(self, ticker: str) -> pd.DataFrame:
-        return pd.read_sql_query(
-            "SELECT run_date, variant_id, sizing_method, beat_bh, beat_rf, "
-            "excess_cagr_vs_bh, strategy_cagr, max_drawdown, turnover_annual "
-            "FROM simulations WHERE ticker=? ORDER BY run_date",
-            self.conn,
-            params=(ticker.upper(),),
-        )
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT run_date, variant_id, sizing_method, beat_bh, beat_rf, "
+                "excess_cagr_vs_bh, strategy_cagr, max_drawdown, turnover_annual "
+                "FROM simulations WHERE ticker=? ORDER BY run_date",
+                self.conn,
+                params=(ticker.upper(),),
+            )
 
 
 def make_cached_downloader(store: Store, base_downloader, ttl_days: int = 1):
@@ -243,3 +284,40 @@ def make_cached_downloader(store: Store, base_downloader, ttl_days: int = 1):
         return df
 
     return _dl
+
+
+def news_cache_key(kwargs: dict) -> str:
+    """Stable key for a NewsAPI query: a hash of its sorted keyword arguments."""
+    return hashlib.sha256(json.dumps(kwargs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class CachedNewsClient:
+    """
+    Wrap a NewsAPI client so identical ``get_everything`` queries are served from
+    SQLite for ``ttl_hours``, sparing the free tier's daily request quota on re-runs.
+    Only responses that carried articles are cached; errors and empty pages always
+    go back to the network.
+    """
+
+    def __init__(self, store: Store, client, ttl_hours: float = 6) -> None:
+        self._store = store
+        self._client = client
+        self._ttl_hours = ttl_hours
+
+    def get_everything(self, **kwargs):
+        key = news_cache_key(kwargs)
+        try:
+            cached = self._store.cached_news(key, ttl_hours=self._ttl_hours)
+        except Exception as exc:  # noqa: BLE001 - caching must never break a run
+            logger.warning("could not read news cache: %s", scrub(exc))
+            cached = None
+        if cached is not None:
+            logger.info("news cache hit for %s", scrub(kwargs.get("q", "")))
+            return cached
+        resp = self._client.get_everything(**kwargs)
+        if isinstance(resp, dict) and not resp.get("code") and resp.get("articles"):
+            try:
+                self._store.put_news(key, resp)
+            except Exception as exc:  # noqa: BLE001 - caching must never break a run
+                logger.warning("could not cache news: %s", scrub(exc))
+        return resp
@@ -26,7 +26,7 @@ def monthly() -> pd.Series:
 
 @pytest.fixture
 def fake_downloader():
-    def _dl(ticker, start=None, end=None, progress=False, auto_adjust=True):
+    def _dl(ticker, start=None, end=None, progress=False, auto_adjust=True, **_kw):
         days = pd.bdate_range("2015-01-01", "2024-12-31")
         n = len(days)
         base = (
@@ -34,10 +34,15 @@ def fake_downloader():
             + 10 * np.sin(2 * np.pi * np.arange(n) / 252)
             + np.random.default_rng(1).normal(0, 1.5, n)
         )
-        return pd.DataFrame(
+        frame = pd.DataFrame(
             {"Open": base, "High": base * 1.01, "Low": base * 0.99, "Close": base, "Volume": 1e6},
             index=days,
         )
+        symbols = ticker.split()
+        if len(symbols) == 1:
+            return frame
+        # Multi-symbol request with group_by="ticker": (ticker, field) columns.
+        return pd.concat({s: frame for s in symbols}, axis=1)
 
     return _dl
 
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 
 from stockpredictor import cli, data
 
@@ -71,3 +74,148 @@ def test_cli_simulate_writes_scorecard_and_artifacts(
     files = os.listdir(tmp_path / subdirs[0])
     assert any(f.endswith("_SIM_equity.png") for f in files)
     assert any(f.endswith("_SIM_metrics.json") for f in files)
+
+
+def test_cli_parallel_workers_isolate_failing_ticker(fake_downloader, tmp_path, monkeypatch):
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    def flaky(ticker, **kw):
+        if "BAD" in ticker.split():
+            raise ValueError("no data for BAD")  # batch fails too -> per-ticker fallback
+        return fake_downloader(ticker, **kw)
+
+    monkeypatch.setattr(data, "_default_downloader", flaky)
+
+    code = cli.main(
+        [
+            "--tickers",
+            "NVDA,BAD,AAPL",
+            "--start",
+            "2015-01-01",
+            "--end",
+            "2024-12-31",
+            "--outdir",
+            str(tmp_path),
+            "--no-backtest",
+            "--no-cache",
+            "--workers",
+            "3",
+        ]
+    )
+    assert code == 0  # one failure out of three is not a failed run
+    subdirs = [d for d in os.listdir(tmp_path) if os.path.isdir(tmp_path / d)]
+    files = os.listdir(tmp_path / subdirs[0])
+    assert {f.split("_")[0] for f in files if f.endswith("_metrics.json")} == {"NVDA", "AAPL"}
+
+
+def test_cli_fits_in_process_pool(fake_downloader, tmp_path, monkeypatch):
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+    monkeypatch.setattr(data, "_default_downloader", fake_downloader)
+
+    code = cli.main(
+        [
+            "--tickers",
+            "NVDA,AAPL",
+            "--start",
+            "2015-01-01",
+            "--end",
+            "2024-12-31",
+            "--outdir",
+            str(tmp_path),
+            "--no-cache",
+            "--forecast-processes",
+            "2",
+        ]
+    )
+    assert code == 0
+    subdirs = [d for d in os.listdir(tmp_path) if os.path.isdir(tmp_path / d)]
+    files = os.listdir(tmp_path / subdirs[0])
+    assert sum(f.endswith("_metrics.json") for f in files) == 2
+
+
+def test_help_does_not_import_heavy_dependencies():
+    # A fresh interpreter: this test session has long since imported statsmodels.
+    probe = (
+        "import sys\n"
+        "from stockpredictor import cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('statsmodels', 'matplotlib', 'yfinance', 'newsapi', 'vaderSentiment')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+    )
+    out = subprocess.run(  # noqa: S603 - fixed argv, our own interpreter
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    ).stdout
+    assert out.strip().splitlines()[-1] == "[]"
+
+
+def test_cli_reports_in_ticker_order_not_completion_order(fake_downloader, tmp_path, monkeypatch):
+    import sqlite3
+    import time
+
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    def slow_first(ticker, **kw):
+        if len(ticker.split()) > 1:
+            raise ValueError("batch unavailable")  # force per-ticker downloads on the pool
+        if ticker == "NVDA":
+            time.sleep(0.5)  # finishes last
+        return fake_downloader(ticker, **kw)
+
+    monkeypatch.setattr(data, "_default_downloader", slow_first)
+    db = tmp_path / "order.db"
+    code = cli.main(
+        [
+            "--tickers",
+            "NVDA,AAPL,MSFT",
+            "--start",
+            "2015-01-01",
+            "--end",
+            "2024-12-31",
+            "--outdir",
+            str(tmp_path),
+            "--no-backtest",
+            "--db",
+            str(db),
+            "--workers",
+            "3",
+        ]
+    )
+    assert code == 0
+    with sqlite3.connect(db) as conn:
+        rows = [r[0] for r in conn.execute("SELECT ticker FROM runs ORDER BY id")]
+    assert rows == ["NVDA", "AAPL", "MSFT"]
+
+
+def test_cli_rejects_statsforecast_backend_when_not_installed(monkeypatch, capsys):
+    import importlib.util
+
+    import pytest
+
+    real = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *a: None if name == "statsforecast" else real(name, *a),
+    )
+    with pytest.raises(SystemExit) as exc:
+        cli.main(
+            [
+                "--tickers",
+                "NVDA",
+                "--start",
+                "2015-01-01",
+                "--end",
+                "2024-12-31",
+                "--forecast-backend",
+                "statsforecast",
+            ]
+        )
+    assert exc.value.code == 2
+    assert "fast extra" in capsys.readouterr().err
@@ -62,7 +62,70 @@ def test_to_monthly_mean_smooths_below_last_for_rising_series():
     assert (last > mean).all()
 
 
+def test_to_monthly_casts_nullable_close_to_float64():
+    days = pd.date_range("2020-01-01", "2020-03-31", freq="D")
+    close = pd.array(np.arange(1.0, len(days) + 1), dtype="Float64")
+    close[5] = pd.NA
+    df = pd.DataFrame({"Close": close}, index=days)
+    monthly, warns = data.to_monthly(df, "TST")
+    assert monthly.dtype == np.float64
+    assert len(monthly) == 3
+    assert any("NaN" in w for w in warns)
+
+
 def test_to_monthly_invalid_agg_raises():
     df = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.date_range("2020-01-01", periods=2))
     with pytest.raises(ValueError):
         data.to_monthly(df, "TST", agg="median")
+
+
+def test_fetch_prices_batch_splits_and_chunks(fake_downloader):
+    calls = []
+
+    def counting(tickers, **kw):
+        calls.append(tickers)
+        return fake_downloader(tickers, **kw)
+
+    tickers = [f"T{i}" for i in range(25)]
+    out = data.fetch_prices_batch(tickers, "2015-01-01", "2024-12-31", downloader=counting)
+    assert len(calls) == 2  # 20 + 5 symbols, not 25 requests
+    assert set(out) == set(tickers)
+    assert list(out["T3"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+
+def test_fetch_prices_batch_omits_missing_symbols(fake_downloader):
+    def partial(tickers, **kw):
+        return fake_downloader("AAPL MSFT", **kw)  # NOPE absent from the response
+
+    out = data.fetch_prices_batch(["AAPL", "NOPE"], "2015-01-01", "2024-12-31", downloader=partial)
+    assert set(out) == {"AAPL"}
+
+
+def test_default_downloader_never_overlaps_yf_download(monkeypatch):
+    import sys
+    import threading
+    import time
+    import types
+
+    active, overlaps = [0], []
+    guard = threading.Lock()
+
+    def download(*_a, **_k):
+        with guard:
+            active[0] += 1
+            overlaps.append(active[0] > 1)
+        time.sleep(0.02)
+        with guard:
+            active[0] -= 1
+        return pd.DataFrame({"Close": [1.0]})
+
+    fake = types.ModuleType("yfinance")
+    fake.download = download
+    monkeypatch.setitem(sys.modules, "yfinance", fake)
+    threads = [threading.Thread(target=data._default_downloader, args=("T",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(overlaps) == 4
+    assert not any(overlaps)
@@ -36,6 +36,27 @@ def test_non_seasonal_fallback_below_24_months(cfg):
     assert len(res.point) == cfg.horizon
 
 
+def test_short_ramp_trend_is_damped(cfg):
+    idx = pd.date_range("2023-01-31", periods=12, freq="ME")
+    s = pd.Series(np.linspace(10, 40, 12), index=idx)
+    res = fc.forecast_with_intervals(s, cfg)
+    # An undamped log-trend compounds to ~4.5x the last price over 12 months.
+    assert res.point.iloc[-1] < 2 * s.iloc[-1]
+
+
+def test_flat_series_skips_fit(cfg, monkeypatch):
+    def _boom(*_a, **_k):
+        raise AssertionError("flat series should not be fitted")
+
+    monkeypatch.setattr(fc, "_fit_holt_winters", _boom)
+    idx = pd.date_range("2023-01-31", periods=30, freq="ME")
+    res = fc.forecast_with_intervals(pd.Series(50.0, index=idx), cfg)
+    assert (res.point == 50.0).all()
+    lo, hi = res.intervals[95]
+    assert (lo == 50.0).all() and (hi == 50.0).all()
+    assert res.point.index[0] > idx[-1]
+
+
 def test_baselines_shapes(monthly, cfg):
     for fn in (fc.naive_forecast, fc.drift_forecast):
         out = fn(monthly, cfg.horizon)
@@ -102,3 +123,155 @@ def test_interval_coverage_fraction():
     assert fc.interval_coverage(y, lo, np.full(4, 0.5)) == 0.0
     # Covers points 1, 3, 4 but not 2 -> 0.75.
     assert fc.interval_coverage(y, lo, np.array([1.5, 1.5, 5.0, 5.0])) == 0.75
+
+
+def test_statsforecast_backend_falls_back_without_package(monthly, cfg, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "statsforecast", None)  # import -> ImportError
+    cfg.forecast_backend = "statsforecast"
+    out = fc.holt_winters_model_fn(cfg)(monthly, 6)
+    cfg.forecast_backend = "statsmodels"
+    ref = fc.holt_winters_model_fn(cfg)(monthly, 6)
+    assert np.allclose(out.values, ref.values)
+
+
+def test_statsforecast_backend_uses_autoets(monthly, cfg, monkeypatch):
+    import sys
+    import types
+
+    class FakeAutoETS:
+        def __init__(self, season_length, model, damped):
+            self.spec = (season_length, model, damped)
+
+        def fit(self, y):
+            self.last = y[-1]
+            return self
+
+        def predict(self, h):
+            return {"mean": np.full(h, self.last)}
+
+    mod = types.ModuleType("statsforecast.models")
+    mod.AutoETS = FakeAutoETS
+    monkeypatch.setitem(sys.modules, "statsforecast", types.ModuleType("statsforecast"))
+    monkeypatch.setitem(sys.modules, "statsforecast.models", mod)
+    cfg.forecast_backend = "statsforecast"
+    out = fc.holt_winters_model_fn(cfg)(monthly, 4)
+    # Fitted in log space and exponentiated back: a flat fake forecast = last price.
+    assert np.allclose(out.values, monthly.iloc[-1])
+    assert out.index[0] > monthly.index[-1]
+
+
+def test_grid_backend_tracks_trend_and_season(monthly, cfg):
+    cfg.forecast_backend = "grid"
+    out = fc.holt_winters_model_fn(cfg)(monthly.iloc[:-6], 6)
+    assert out.index[0] > monthly.index[-7]
+    assert (out > 0).all()
+    # Comparable to statsmodels on the shared seasonal fixture.
+    assert np.mean(np.abs(out.values - monthly.iloc[-6:].values)) < 0.1 * monthly.mean()
+
+
+def test_grid_search_non_seasonal_damped_trend():
+    from stockpredictor import hwgrid
+
+    out, (alpha, beta, gamma, phi) = hwgrid.fit_forecast(np.arange(10.0, 30.0), 3, seasonal=False)
+    assert np.allclose(out, [30.0, 31.0, 32.0], atol=0.3)
+    assert np.all(np.diff(out) < 1.0)  # damped: each step adds less than the trend
+    assert gamma == 0.0
+    assert phi < 1.0
+    with pytest.raises(ValueError):
+        hwgrid.fit_forecast(np.arange(10.0), 3, m=12)
+
+
+def test_grid_backend_damps_short_ramp(cfg):
+    idx = pd.date_range("2023-01-31", periods=12, freq="ME")
+    s = pd.Series(np.linspace(10, 40, 12), index=idx)
+    cfg.forecast_backend = "grid"
+    out = fc.holt_winters_model_fn(cfg)(s, 12)
+    assert out.iloc[-1] < 2 * s.iloc[-1]  # undamped it reaches ~3x the last price
+
+
+def test_grid_backend_falls_back_to_statsmodels(monthly, cfg, monkeypatch, caplog):
+    import logging
+
+    from stockpredictor import hwgrid
+
+    def _fail(*_a, **_k):
+        raise ValueError("seasonal fit needs >= 24 points")
+
+    monkeypatch.setattr(hwgrid, "fit_forecast", _fail)
+    monkeypatch.setattr(fc, "_FALLBACK_WARNED", set())
+    cfg.forecast_backend = "grid"
+    with caplog.at_level(logging.DEBUG, logger="stockpredictor.forecast"):
+        out = fc.holt_winters_model_fn(cfg)(monthly, 6)
+        fc.holt_winters_model_fn(cfg)(monthly, 6)
+    cfg.forecast_backend = "statsmodels"
+    ref = fc.holt_winters_model_fn(cfg)(monthly, 6)
+    assert np.allclose(out.values, ref.values)
+    levels = [r.levelno for r in caplog.records if "grid backend failed" in r.getMessage()]
+    assert levels == [logging.WARNING, logging.DEBUG]
+
+
+def test_grid_backend_is_backtested_under_its_own_key(monthly, cfg):
+    cfg.forecast_backend = "grid"
+    summary = fc.backtest(monthly, cfg)
+    assert "holt_winters[grid]" in summary
+    # Coverage belongs to the statsmodels row it was computed from, not the grid row.
+    assert "coverage80" in summary["holt_winters"]
+    assert "coverage80" not in summary["holt_winters[grid]"]
+
+
+def test_statsforecast_backend_is_backtested_under_its_own_key(monthly, cfg):
+    cfg.forecast_backend = "statsforecast"
+    models = fc.default_models(cfg)
+    assert list(models)[:2] == ["holt_winters", "holt_winters[statsforecast]"]
+    # The plain row stays on statsmodels, matching the live forecast and coverage.
+    hw = models["holt_winters"](monthly, 6)
+    cfg.forecast_backend = "statsmodels"
+    assert np.allclose(hw.values, fc.holt_winters_model_fn(cfg)(monthly, 6).values)
+    assert set(fc.default_models(cfg)) == {"holt_winters", "naive", "seasonal_naive", "drift"}
+
+
+def test_missing_statsforecast_warns_once(monthly, cfg, monkeypatch, caplog):
+    import logging
+    import sys
+
+    monkeypatch.setitem(sys.modules, "statsforecast.models", None)  # import -> ImportError
+    monkeypatch.setattr(fc, "_FALLBACK_WARNED", set())
+    fn = fc.holt_winters_model_fn(cfg, "statsforecast")
+    with caplog.at_level(logging.DEBUG, logger="stockpredictor.forecast"):
+        fn(monthly, 3)
+        fn(monthly, 3)
+    levels = [r.levelno for r in caplog.records if "falling back" in r.getMessage()]
+    assert levels == [logging.WARNING, logging.DEBUG]
+
+
+def test_quiet_warnings_restores_filters_after_overlapping_threads():
+    import threading
+    import warnings
+
+    before = list(warnings.filters)
+    a_in, b_in, a_out = threading.Event(), threading.Event(), threading.Event()
+    quiet: list[bool] = []
+
+    def first():
+        with fc._quiet_warnings():
+            a_in.set()
+            b_in.wait()
+        a_out.set()  # leaves while the second fit is still running
+
+    def second():
+        a_in.wait()
+        with fc._quiet_warnings():
+            b_in.set()
+            a_out.wait()
+            quiet.append(any(f[0] == "ignore" for f in warnings.filters))
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert quiet == [True]  # the second fit stayed quiet after the first left
+    # Per-fit catch_warnings would have re-installed "ignore" here for good.
+    assert warnings.filters == before
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from stockpredictor import news
 
 NOOP = lambda _s: None  # noqa: E731
@@ -36,6 +38,8 @@ def test_company_map_dedup_and_lookup():
     assert list(news._COMPANY_NAMES).count("NFLX") == 1
     assert news.ticker_to_company_name("NFLX") == "Netflix"
     assert news.ticker_to_company_name("ZZZZ") == "ZZZZ"  # passthrough
+    with pytest.raises(TypeError):
+        news._COMPANY_NAMES["ZZZZ"] = "Z Corp"  # frozen at import
 
 
 def test_retry_drops_dates_on_far_in_past(cfg):
@@ -61,3 +65,23 @@ def test_normalized_article_keys(cfg):
     c = Client([ARTS])
     out = news.fetch_articles(c, "TSLA", end_date="2024-12-31", cfg=cfg, sleeper=NOOP)
     assert set(out[0]) == {"title", "description", "url", "source", "publishedAt"}
+
+
+def test_normalize_fills_missing_fields():
+    out = news._normalize([ARTS["articles"][0], {"title": None, "source": None}])
+    assert out[0]["source"] == "S"
+    assert out[1] == {
+        "title": "",
+        "description": "",
+        "url": None,
+        "source": None,
+        "publishedAt": None,
+    }
+
+
+def test_http_session_pools_and_retries_server_errors():
+    session = news.http_session()
+    adapter = session.get_adapter("https://newsapi.org/v2/everything")
+    assert adapter.max_retries.total == 2
+    assert 429 not in adapter.max_retries.status_forcelist  # fetch_articles owns 429
+    assert adapter._pool_maxsize == news.config.NEWS_MAX_CONCURRENCY
@@ -36,3 +36,40 @@ def test_persist_outputs_writes_files(cfg, fake_downloader, fake_news_client, tm
     payload = json.loads(open(paths["metrics"]).read())
     assert set(payload["intervals"]) == {"80", "95"}
     assert "holt_winters" in payload["backtest"]
+
+
+def test_prefetch_prices_serves_cache_then_batches_the_rest(cfg, fake_downloader, tmp_path):
+    from stockpredictor import store
+
+    calls = []
+
+    def counting(tickers, **kw):
+        calls.append(tickers)
+        return fake_downloader(tickers, **kw)
+
+    with store.Store(str(tmp_path / "p.db")) as s:
+        s.upsert_prices("NVDA", fake_downloader("NVDA"))
+        prices = pipeline.prefetch_prices(
+            ["NVDA", "AAPL", "MSFT"], cfg, downloader=counting, store=s
+        )
+        assert calls == ["AAPL MSFT"]  # one batched request for the cache misses
+        assert set(prices) == {"NVDA", "AAPL", "MSFT"}
+        assert s.cached_prices("AAPL", cfg.start, cfg.end) is not None  # written back
+
+    res = pipeline.run_ticker("AAPL", cfg, prices=prices["AAPL"])
+    assert len(res.forecast.point) == cfg.horizon
+
+
+def test_news_json_round_trips_with_and_without_orjson(
+    cfg, fake_downloader, fake_news_client, tmp_path, monkeypatch
+):
+    import sys
+
+    res = pipeline.run_ticker(
+        "NVDA", cfg, price_downloader=fake_downloader, news_client=fake_news_client()
+    )
+    fast = pipeline.persist_outputs(res, str(tmp_path / "fast"), cfg)
+    monkeypatch.setitem(sys.modules, "orjson", None)  # force the stdlib fallback
+    slow = pipeline.persist_outputs(res, str(tmp_path / "slow"), cfg)
+    for paths in (fast, slow):
+        assert json.loads(open(paths["news"]).read()) == res.articles
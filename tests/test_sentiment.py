@@ -73,3 +73,81 @@ def test_tilt_disabled_returns_unchanged():
     strong = sentiment.aggregate_sentiment([0.9] * 6)
     out = sentiment.apply_sentiment_tilt(forecast, strong, cfg)
     assert np.allclose(out.values, forecast.values)
+
+
+def test_score_articles_prefers_batch_scoring():
+    class BatchScorer(FixedScorer):
+        def __init__(self):
+            self.batches = []
+
+        def score_batch(self, texts):
+            self.batches.append(list(texts))
+            return [self.score(t) for t in texts]
+
+    scorer = BatchScorer()
+    arts = [{"title": "good news", "description": "more"}, {"title": "bad day"}]
+    assert sentiment.score_articles(arts, scorer) == [0.8, -0.8]
+    assert scorer.batches == [["good news. more", "bad day"]]
+
+
+def test_vader_strips_emoji_before_scoring():
+    class Recorder:
+        def __init__(self):
+            self.seen = []
+
+        def polarity_scores(self, text):
+            self.seen.append(text)
+            return {"compound": 0.5}
+
+    rec = Recorder()
+    scorer = sentiment.VaderScorer(analyzer=rec)
+    assert scorer.score("Stock soars \U0001f680\U0001f680\U0001f680") == 0.5
+    assert scorer.score("\U0001f680") == 0.0  # nothing left to score
+    assert rec.seen == ["Stock soars "]
+
+
+def test_vader_analyzer_is_shared_across_scorers():
+    a, b = sentiment.VaderScorer(), sentiment.VaderScorer()
+    assert a._analyzer is b._analyzer
+    assert a.score("great results") > 0
+
+
+def test_finbert_scorer_serializes_pipeline_calls_across_threads(monkeypatch):
+    import sys
+    import threading
+    import time
+    import types
+
+    active, overlaps = [0], []
+    guard = threading.Lock()
+
+    def pipe(inputs):
+        with guard:
+            active[0] += 1
+            overlaps.append(active[0] > 1)
+        time.sleep(0.02)
+        with guard:
+            active[0] -= 1
+        labels = [{"label": "positive", "score": 0.75}, {"label": "negative", "score": 0.25}]
+        return [labels] * (len(inputs) if isinstance(inputs, list) else 1)
+
+    fake = types.ModuleType("transformers")
+    fake.pipeline = lambda *_a, **_k: pipe
+    monkeypatch.setitem(sys.modules, "transformers", fake)
+    scorer = sentiment.FinBertScorer()
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(scorer.score("up"))) for _ in range(3)
+    ]
+    threads += [
+        threading.Thread(target=lambda: results.append(scorer.score_batch(["a", "", "b"])))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(overlaps) == 6
+    assert not any(overlaps)
+    assert results.count(0.5) == 3
+    assert results.count([0.5, 0.0, 0.5]) == 3
@@ -31,3 +31,23 @@ def test_save_run_and_history(tmp_path, cfg, fake_downloader, fake_news_client):
         hist = s.history("NVDA")
         assert len(hist) == 1
         assert hist.iloc[0]["sentiment_label"] == res.sentiment.label()
+
+
+def test_news_cache_serves_repeat_queries(tmp_path, fake_news_client):
+    inner = fake_news_client()
+    with store.Store(str(tmp_path / "n.db")) as s:
+        client = store.CachedNewsClient(s, inner)
+        first = client.get_everything(q="Apple", page_size=3)
+        second = client.get_everything(page_size=3, q="Apple")  # same query, other order
+        client.get_everything(q="Apple", page_size=5)
+        assert len(inner.calls) == 2  # the repeat was served from SQLite
+        assert second == first
+
+
+def test_news_cache_skips_error_responses(tmp_path, fake_news_client):
+    inner = fake_news_client(responses=[{"code": "rateLimited", "message": "slow down"}])
+    with store.Store(str(tmp_path / "e.db")) as s:
+        client = store.CachedNewsClient(s, inner)
+        client.get_everything(q="Apple")
+        client.get_everything(q="Apple")
+        assert len(inner.calls) == 2  # errors are never cached
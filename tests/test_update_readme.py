@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import re
+from datetime import date
 from pathlib import Path
 
+import pytest
+
 _SPEC = importlib.util.spec_from_file_location(
     "update_readme_date", Path(__file__).resolve().parent.parent / "update_readme_date.py"
 )
@@ -18,6 +22,14 @@ def test_get_last_friday_format():
     assert re.fullmatch(r"\d{4}-\d{2}-\d{2}", val)
 
 
+def test_last_friday_for_each_weekday():
+    # 2024-12-16 is a Monday; Friday the 20th maps to itself.
+    expected = ["2024-12-13"] * 4 + ["2024-12-20"] * 3
+    for offset, want in enumerate(expected):
+        day = date(2024, 12, 16 + offset)
+        assert urd._last_friday_for(day.toordinal()) == want
+
+
 def test_update_writes_when_pattern_present(tmp_path, monkeypatch):
     readme = tmp_path / "README.md"
     readme.write_text("cmd \\\n  --end   2020-01-01 \\\n  --outdir x\n")
@@ -40,3 +52,152 @@ def test_no_match_is_safe_noop(tmp_path, monkeypatch, capsys):
 def test_missing_file_reports_and_returns_false(tmp_path, monkeypatch):
     monkeypatch.setattr(urd, "README_PATH", tmp_path / "does_not_exist.md")
     assert urd.update_readme() is False
+
+
+def test_only_the_template_end_date_is_rewritten(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text(
+        "stock-forecast \\\n  --end   2020-01-01 \\\n  --outdir x\n"
+        "stock-forecast --start 2010-01-01 --end 2024-12-31 \\\n  --simulate\n"
+    )
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is True
+    text = readme.read_text()
+    assert f"--end   {urd.get_last_friday()} \\" in text
+    assert "--end 2024-12-31 \\" in text  # other examples keep their fixed dates
+
+
+def test_up_to_date_readme_is_not_rewritten(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text(f"cmd \\\n  --end   {urd.get_last_friday()} \\\n")
+    os.utime(readme, ns=(1, 1))
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is False
+    assert readme.stat().st_mtime_ns == 1  # no write, so watchers see no change
+
+
+def test_crlf_line_endings_are_preserved(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_bytes(b"cmd \\\r\n  --end   2020-01-01 \\\r\n  --outdir x\r\n")
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is True
+    assert readme.read_bytes().count(b"\r\n") == 3
+
+
+def test_shorter_rewrite_truncates_leftover_bytes(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text("cmd \\\n  --end        2020-01-01 \\\n")  # non-template spacing
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is True
+    assert readme.read_text() == f"cmd \\\n  --end   {urd.get_last_friday()} \\\n"
+
+
+def test_end_date_edit_is_line_anchored(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    # Template spacing (three spaces) and a tab: neither counts when --end is mid-line.
+    for sep in ("   ", "\t"):
+        original = f"run --start 2010-01-01 --end{sep}2020-01-01 \\\n  --simulate\n"
+        readme.write_text(original)
+        assert urd.update_readme() is False
+        assert readme.read_text() == original
+
+
+def test_main_exit_codes(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text("nothing to update\n")
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.main([]) == 0  # no-op warning is not a failure
+    monkeypatch.setattr(urd, "README_PATH", tmp_path / "missing.md")
+    assert urd.main([]) == 1  # cannot read
+
+
+def test_main_fails_when_write_fails(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text("cmd \\\n  --end   2020-01-01 \\\n")
+    monkeypatch.setattr(urd, "README_PATH", readme)
+
+    def _fail(*_a):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(urd, "_atomic_write", _fail)
+    assert urd.main([]) == 1  # the file exists, but could not be written
+
+
+def test_main_updates_every_path_given(tmp_path):
+    first, second = tmp_path / "a.md", tmp_path / "b.md"
+    for p in (first, second):
+        p.write_text("cmd \\\n  --end   2020-01-01 \\\n")
+    assert urd.main([str(first), str(second), str(first)]) == 0
+    for p in (first, second):
+        assert urd.get_last_friday() in p.read_text()
+    assert urd.main([str(first), str(tmp_path / "missing.md")]) == 1
+
+
+def test_main_fails_on_unreadable_existing_path(tmp_path):
+    # Exists, but read_bytes() raises IsADirectoryError.
+    assert urd.main([str(tmp_path)]) == 1
+
+
+def test_failed_replace_keeps_original_and_cleans_up(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    original = "cmd \\\n  --end   2020-01-01 \\\n"
+    readme.write_text(original)
+    monkeypatch.setattr(urd, "README_PATH", readme)
+
+    def _fail(*_a):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(urd.os, "replace", _fail)
+    assert urd.update_readme() is False
+    assert readme.read_text() == original
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]  # no temp file left
+
+
+def test_rewrite_keeps_file_mode(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text("cmd \\\n  --end   2020-01-01 \\\n")
+    readme.chmod(0o644)
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is True
+    assert readme.stat().st_mode & 0o777 == 0o644
+
+
+def test_every_template_line_updated_and_mid_line_end_kept(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_bytes(
+        b"run --start 2010-01-01 --end   2020-01-01 \\\n  --simulate\n"
+        b"cmd \\\n  --end   2020-01-01 \\\n"
+        b"cmd \\\n  --end   2021-01-01 \\\n"
+    )
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.update_readme() is True
+    text = readme.read_text()
+    friday = urd.get_last_friday()
+    assert text.startswith("run --start 2010-01-01 --end   2020-01-01 \\\n")
+    assert text.count(f"  --end   {friday} \\\n") == 2
+
+
+@pytest.mark.skipif(
+    hasattr(os, "geteuid") and os.geteuid() == 0, reason="root can write read-only files"
+)
+def test_read_only_readme_is_not_replaced(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    original = "cmd \\\n  --end   2020-01-01 \\\n"
+    readme.write_text(original)
+    readme.chmod(0o444)
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    assert urd.main([]) == 1
+    assert readme.read_text() == original
+
+
+def test_unwritable_readme_is_reported_not_replaced(tmp_path, monkeypatch, capsys):
+    readme = tmp_path / "README.md"
+    original = "cmd \\\n  --end   2020-01-01 \\\n"
+    readme.write_text(original)
+    monkeypatch.setattr(urd, "README_PATH", readme)
+    monkeypatch.setattr(urd.os, "access", lambda *_a: False)
+    assert urd.update_readme() is False
+    assert readme.read_text() == original
+    assert "could not write" in capsys.readouterr().err
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
@@ -2,73 +2,156 @@
 """
 Script to update the README.md file with the current last Friday date.
 This ensures the README always shows the most recent Friday for stock analysis examples.
+
+Usage: update_readme_date.py [README ...]  (defaults to this repo's README.md)
 """
 
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
 import re
+import stat
 import sys
-from datetime import datetime, timedelta
+import tempfile
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 # Resolve README relative to this script, not the current working directory,
 # so the tool works regardless of where it is invoked from.
 README_PATH = Path(__file__).resolve().parent / "README.md"
 
-# Matches the example command's end date, e.g. "--end   2025-08-29 \"
-END_DATE_PATTERN = r"--end\s+\d{4}-\d{2}-\d{2}\s+\\"
+# Matches the example command's end-date line, e.g. "  --end   2025-08-29 \".
+# Anchored to a whole line and limited to spaces/tabs, so \s+ can never run
+# across newlines and the match cannot start mid-line in another command. This is
+# the only matcher, so the guarantee holds for every edit the script makes.
+END_DATE_PATTERN = r"^([ \t]*)--end[ \t]+\d{4}-\d{2}-\d{2}[ \t]+\\[ \t]*(\r?)$"
+_END_DATE_RE = re.compile(END_DATE_PATTERN.encode("ascii"), re.MULTILINE)
+# The regex runs on the raw bytes (the edit is pure ASCII, so the file is never
+# decoded) and rewrites each matched line in the template's own layout.
+_END_FLAG = b"--end   "
+# Days back to the most recent Friday, indexed by date.weekday() (Mon=0 .. Sun=6).
+_DAYS_BACK = (3, 4, 5, 6, 0, 1, 2)
+
+
+@lru_cache(maxsize=8)
+def _last_friday_for(ordinal: int) -> str:
+    """The last Friday on or before the day with proleptic ordinal ``ordinal``."""
+    day = date.fromordinal(ordinal)
+    return (day - timedelta(days=_DAYS_BACK[day.weekday()])).isoformat()
 
 
 def get_last_friday() -> str:
     """Calculate the last Friday on or before today (YYYY-MM-DD)."""
-    today = datetime.now()
-    days_since_friday = (today.weekday() - 4) % 7
-    last_friday = today - timedelta(days=days_since_friday)
-    return last_friday.strftime("%Y-%m-%d")
+    return _last_friday_for(date.today().toordinal())
 
 
-def update_readme() -> bool:
+def _replace_end_date(content: bytes, last_friday: str) -> tuple[bytes, int]:
     """
-    Update README.md with the current last Friday date.
+    Return ``(new_content, n_replacements)`` with every end-date line of the example
+    command set to ``last_friday``. Only lines that *start* with ``--end`` match, so
+    other commands in the README that pass ``--end`` mid-line keep their fixed dates.
+    """
+    new_date = last_friday.encode("ascii")
+    # Rebuild the line in the template's layout, keeping its indentation and line
+    # ending. A callable replacement keeps re.sub from interpreting the trailing
+    # backslash as an escape sequence.
+    return _END_DATE_RE.subn(
+        lambda m: m[1] + _END_FLAG + new_date + b" \\" + m[2],
+        content,
+    )
 
-    Returns True if the file was changed, False otherwise. Raises no exceptions
-    for the common failure cases (missing/unwritable file); they are reported and
-    cause a non-zero exit instead.
+
+def _atomic_write(path: Path, data: bytes) -> None:
     """
+    Replace ``path`` with ``data`` via a synced sibling temp file and ``os.replace``,
+    so a crash mid-write leaves either the old README or the new one, never half.
+
+    The rename would succeed over a read-only file in a writable directory, so
+    the file's own write permission is checked first, as an in-place write would.
+    The new file keeps the old permission bits but is owned by the current user,
+    and hard links to the old README keep pointing at the old contents.
+    """
+    target = path.resolve()  # rename onto the real file, not over a symlink
+    if not os.access(target, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(target))
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, stat.S_IMODE(target.stat().st_mode))  # mkstemp creates 0600
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+# Outcome of one README update. Only a failure (could not read or write the file)
+# makes the process exit non-zero; a missing pattern is a warning, not an error.
+_CHANGED, _UNCHANGED, _FAILED = "changed", "unchanged", "failed"
+
+
+def _update(path: Path) -> str:
+    """Update one README; returns _CHANGED, _UNCHANGED or _FAILED (already reported)."""
     last_friday = get_last_friday()
 
     try:
-        content = README_PATH.read_text(encoding="utf-8")
-    except (FileNotFoundError, OSError) as exc:
-        print(f"Error: could not read {README_PATH}: {exc}", file=sys.stderr)
-        return False
+        content = path.read_bytes()
+    except OSError as exc:
+        print(f"Error: could not read {path}: {exc}", file=sys.stderr)
+        return _FAILED
 
-    # Use a callable replacement so re.sub does not interpret the trailing
-    # backslash in the example command as an escape sequence.
-    replacement = f"--end   {last_friday} \\"
-    updated_content, n_subs = re.subn(END_DATE_PATTERN, lambda _m: replacement, content)
+    updated_content, n_subs = _replace_end_date(content, last_friday)
 
     if n_subs == 0:
         print(
-            f"Warning: no '--end <date>' pattern found in {README_PATH.name}; nothing was updated.",
+            f"Warning: no '--end <date>' pattern found in {path.name}; nothing was updated.",
             file=sys.stderr,
         )
-        return False
+        return _UNCHANGED
 
     if updated_content == content:
-        print(f"README.md already up to date (last Friday: {last_friday}).")
-        return False
+        print(f"{path} already up to date (last Friday: {last_friday}).")
+        return _UNCHANGED
 
     try:
-        README_PATH.write_text(updated_content, encoding="utf-8")
+        _atomic_write(path, updated_content)
     except OSError as exc:
-        print(f"Error: could not write {README_PATH}: {exc}", file=sys.stderr)
-        return False
+        print(f"Error: could not write {path}: {exc}", file=sys.stderr)
+        return _FAILED
+
+    print(f"Updated {path} with last Friday date: {last_friday} ({n_subs} replacement(s)).")
+    return _CHANGED
+
+
+def update_readme(path: Path | None = None) -> bool:
+    """
+    Update a README (default: ``README_PATH``) with the current last Friday date.
 
-    print(f"Updated README.md with last Friday date: {last_friday} ({n_subs} replacement(s)).")
-    return True
+    Returns True if the file was changed, False otherwise. Raises no exceptions
+    for the common failure cases (unreadable/unwritable file); they are reported
+    on stderr, and ``main`` turns them into a non-zero exit.
+    """
+    return _update(README_PATH if path is None else path) == _CHANGED
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point: update each README path given (default: this
+    repo's README.md). Exits 1 if any file could not be read or written, else 0 —
+    a missing pattern only warns, so it does not break opportunistic CI hooks.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    # Each distinct file is processed once; the compiled pattern is shared by all.
+    paths = list(dict.fromkeys(Path(a) for a in args)) or [README_PATH]
+    outcomes = [_update(path) for path in paths]
+    return 1 if _FAILED in outcomes else 0
 
 
 if __name__ == "__main__":
-    changed = update_readme()
-    # Exit non-zero only on hard failure (could not read/write); a no-op match
-    # warning still exits 0 so it does not break opportunistic CI hooks.
-    sys.exit(0 if (changed or README_PATH.exists()) else 1)
+    sys.exit(main())